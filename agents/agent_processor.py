@@ -5,7 +5,6 @@ Manages the series processing of agents with fail-fast behavior.
 If any agent fails, processing stops immediately and the user is informed.
 """
 
-import asyncio
 import logging
 from typing import List, Dict, Any, Optional, Tuple
 from .base_agent import BaseAgent, AgentResult
@@ -113,18 +112,20 @@ class AgentProcessor:
                     
                 except Exception as e:
                     # Agent failed - stop processing immediately
-                    error_msg = f"❌ **AGENT FAILURE** ❌\n\n"
-                    error_msg += f"Agent '{agent.name}' failed while processing your prompt.\n\n"
-                    error_msg += f"**Error:** {str(e)}\n\n"
-                    error_msg += f"**Processing stopped at:** {agent.name} (priority {agent.priority})\n\n"
-                    error_msg += f"**Original prompt returned:** {prompt}\n\n"
-                    error_msg += f"**Recommendations:**\n"
-                    error_msg += f"• Check your prompt for any issues\n"
-                    error_msg += f"• Try rephrasing your request\n"
-                    error_msg += f"• Contact support if the issue persists\n\n"
-                    error_msg += f"**Processing details:**\n"
-                    error_msg += f"• Agents processed: {', '.join(processing_metadata['agents_processed'])}\n"
-                    error_msg += f"• Failed agent: {agent.name}\n"
+                    error_msg = "".join([
+                        "❌ **AGENT FAILURE** ❌\n\n",
+                        f"Agent '{agent.name}' failed while processing your prompt.\n\n",
+                        f"**Error:** {str(e)}\n\n",
+                        f"**Processing stopped at:** {agent.name} (priority {agent.priority})\n\n",
+                        f"**Original prompt returned:** {prompt}\n\n",
+                        "**Recommendations:**\n",
+                        "• Check your prompt for any issues\n",
+                        "• Try rephrasing your request\n",
+                        "• Contact support if the issue persists\n\n",
+                        "**Processing details:**\n",
+                        f"• Agents processed: {', '.join(processing_metadata['agents_processed'])}\n",
+                        f"• Failed agent: {agent.name}\n",
+                    ])
                     
                     logger.error(f"Agent {agent.name} failed: {e}", exc_info=True)
                     
@@ -142,14 +143,16 @@ class AgentProcessor:
             
         except Exception as e:
             # Unexpected error in processor itself
-            error_msg = f"❌ **PROCESSOR FAILURE** ❌\n\n"
-            error_msg += f"An unexpected error occurred in the agent processor.\n\n"
-            error_msg += f"**Error:** {str(e)}\n\n"
-            error_msg += f"**Original prompt returned:** {prompt}\n\n"
-            error_msg += f"**Recommendations:**\n"
-            error_msg += f"• Try again with a simpler prompt\n"
-            error_msg += f"• Check system logs for more details\n"
-            error_msg += f"• Contact support if the issue persists\n"
+            error_msg = "".join([
+                "❌ **PROCESSOR FAILURE** ❌\n\n",
+                "An unexpected error occurred in the agent processor.\n\n",
+                f"**Error:** {str(e)}\n\n",
+                f"**Original prompt returned:** {prompt}\n\n",
+                "**Recommendations:**\n",
+                "• Try again with a simpler prompt\n",
+                "• Check system logs for more details\n",
+                "• Contact support if the issue persists\n",
+            ])
             
             logger.error(f"AgentProcessor failed: {e}", exc_info=True)
             
@@ -6,13 +6,21 @@ command detection rules. It's the final agent in the chain that determines
 whether a prompt should be executed as a shell command or sent to AI.
 """
 
+import hashlib
+import json
+import os
 import re
-import shutil
 import subprocess
+from collections import OrderedDict
+from pathlib import Path
 from typing import Dict, Any, Set, Tuple, Optional
 from .base_agent import BaseAgent, AgentResult
 
 
+# Built-in commands handled by the agent itself
+_BUILTIN_COMMANDS = frozenset({'cd', 'pwd', 'exit'})
+
+
 class CommandRouterAgent(BaseAgent):
     """
     Command Router Agent that decides between Bash and AI execution.
@@ -27,7 +35,8 @@ class CommandRouterAgent(BaseAgent):
     def __init__(self):
         super().__init__("Command Router Agent", priority=100)  # Lowest priority - runs last
         
-        # Get bash commands and builtins
+        # Get bash commands and builtins (cached on disk between runs)
+        self.commands_cache_file = Path.home() / ".awesh" / "bash_commands.json"
         self.bash_commands = self._get_bash_commands()
         
         # Shell syntax patterns that indicate Bash execution
@@ -46,14 +55,74 @@ class CommandRouterAgent(BaseAgent):
             r';',               # command separators
             r'~',               # home directory expansion
         ]
-        self.compiled_patterns = [re.compile(pattern) for pattern in self.shell_syntax_patterns]
+        # Fused into one alternation so detection is a single regex search
+        self.shell_syntax_re = re.compile(
+            '|'.join(f'(?:{pattern})' for pattern in self.shell_syntax_patterns)
+        )
+        
+        self.builtin_commands = _BUILTIN_COMMANDS
         
-        # Built-in commands handled by the agent itself
-        self.builtin_commands = {'cd', 'pwd', 'exit'}
+        # LRU of recent routing decisions; repeated prompts skip classification
+        self.route_cache_size = 512
+        self._route_cache = OrderedDict()
     
     def _get_bash_commands(self) -> Set[str]:
         """Get set of available bash commands, builtins, and aliases"""
+        cache_key = self._commands_cache_key()
+        
+        cached = self._load_commands_cache(cache_key)
+        if cached is not None:
+            return cached
+        
+        commands, complete = self._scan_bash_commands()
+        
+        # Only persist real compgen results, never the fallback lists
+        if complete:
+            self._save_commands_cache(cache_key, commands)
+        
+        return commands
+    
+    def _commands_cache_key(self) -> str:
+        """Build a cache key from PATH and the mtime of each PATH directory"""
+        path = os.environ.get('PATH', '')
+        parts = [path]
+        for directory in path.split(os.pathsep):
+            try:
+                parts.append(str(os.stat(directory).st_mtime_ns))
+            except OSError:
+                parts.append('-')
+        return hashlib.blake2b('\0'.join(parts).encode(), digest_size=16).hexdigest()
+    
+    def _load_commands_cache(self, cache_key: str) -> Optional[Set[str]]:
+        """Load cached commands if the cache matches the current PATH"""
+        try:
+            with open(self.commands_cache_file, 'r') as f:
+                cache = json.load(f)
+            if cache.get('key') == cache_key:
+                return set(cache['commands'])
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        return None
+    
+    def _save_commands_cache(self, cache_key: str, commands: Set[str]):
+        """Persist the command set for the next startup"""
+        try:
+            self.commands_cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.commands_cache_file, 'w') as f:
+                json.dump({'key': cache_key, 'commands': sorted(commands)}, f)
+        except OSError:
+            pass
+    
+    def _scan_bash_commands(self) -> Tuple[Set[str], bool]:
+        """
+        Query bash for builtins and PATH commands.
+        
+        Returns:
+            Tuple of (commands, complete) where complete is False if any
+            fallback list had to be used
+        """
         commands = set()
+        complete = True
         
         # Get bash builtins
         try:
@@ -61,7 +130,10 @@ class CommandRouterAgent(BaseAgent):
                                   capture_output=True, text=True, timeout=5)
             if result.returncode == 0:
                 commands.update(result.stdout.strip().split('\n'))
+            else:
+                complete = False
         except (subprocess.TimeoutExpired, subprocess.SubprocessError):
+            complete = False
             # Fallback to common builtins if compgen fails
             commands.update([
                 'cd', 'pwd', 'echo', 'printf', 'read', 'test', '[', 'export',
@@ -80,7 +152,10 @@ class CommandRouterAgent(BaseAgent):
                                   capture_output=True, text=True, timeout=5)
             if result.returncode == 0:
                 commands.update(result.stdout.strip().split('\n'))
+            else:
+                complete = False
         except (subprocess.TimeoutExpired, subprocess.SubprocessError):
+            complete = False
             # Fallback to common commands
             commands.update([
                 'ls', 'cat', 'grep', 'find', 'awk', 'sed', 'sort', 'uniq',
@@ -93,7 +168,7 @@ class CommandRouterAgent(BaseAgent):
                 'make', 'gcc', 'g++', 'clang', 'gdb', 'valgrind'
             ])
         
-        return commands
+        return commands, complete
     
     def should_handle(self, prompt: str, context: Dict[str, Any]) -> bool:
         """
@@ -109,12 +184,15 @@ class CommandRouterAgent(BaseAgent):
         if not prompt:
             return AgentResult(handled=False, response="")
         
+        # Tokenize once; both checks below only need the first token
+        first_token = self._first_token(prompt)
+        
         # Check for built-in commands first
-        if self._is_builtin_command(prompt):
+        if first_token in self.builtin_commands:
             return await self._handle_builtin_command(prompt, context)
         
         # Check if it's a shell command
-        if self._is_shell_command(prompt):
+        if self._is_shell_command(prompt, first_token):
             return AgentResult(
                 handled=True,
                 response=f"🖥️ **Executing as Bash command:** `{prompt}`\n\n"
@@ -130,51 +208,57 @@ class CommandRouterAgent(BaseAgent):
             metadata={"routing": "ai", "prompt": prompt}
         )
     
-    def _is_builtin_command(self, prompt: str) -> bool:
-        """Check if the prompt is a built-in command"""
-        tokens = prompt.split()
-        if not tokens:
-            return False
+    def _first_token(self, prompt: str) -> str:
+        """Get the first whitespace-delimited token without tokenizing the rest"""
+        tokens = prompt.split(None, 1)
+        return tokens[0] if tokens else ''
+    
+    def _is_shell_command(self, prompt: str, first_token: Optional[str] = None) -> bool:
+        """Determine if the prompt is a shell command, using cached decisions"""
+        cached = self._route_cache.get(prompt)
+        if cached is not None:
+            self._route_cache.move_to_end(prompt)
+            return cached
         
-        first_token = tokens[0]
-        return first_token in self.builtin_commands
+        is_shell = self._detect_shell_command(prompt, first_token)
+        self._route_cache[prompt] = is_shell
+        if len(self._route_cache) > self.route_cache_size:
+            self._route_cache.popitem(last=False)
+        return is_shell
     
-    def _is_shell_command(self, prompt: str) -> bool:
+    def _detect_shell_command(self, prompt: str, first_token: Optional[str] = None) -> bool:
         """
         Determine if the prompt should be executed as a shell command.
         
         Returns True if:
         1. First token is a known bash command/builtin/alias
         2. Contains shell syntax patterns
+        
+        first_token may be passed in when the caller has already extracted it.
         """
-        tokens = prompt.split()
-        if not tokens:
+        if first_token is None:
+            first_token = self._first_token(prompt)
+        if not first_token:
             return False
         
-        first_token = tokens[0]
-        
         # Check if first token is a known command
         if first_token in self.bash_commands:
             return True
         
         # Check for shell syntax patterns
-        for pattern in self.compiled_patterns:
-            if pattern.search(prompt):
-                return True
-        
-        return False
+        return self.shell_syntax_re.search(prompt) is not None
     
     async def _handle_builtin_command(self, prompt: str, context: Dict[str, Any]) -> AgentResult:
         """Handle built-in commands"""
-        tokens = prompt.split()
-        command = tokens[0]
-        args = tokens[1:] if len(tokens) > 1 else []
+        # Split off the command only; just cd looks at its argument
+        parts = prompt.split(None, 1)
+        command = parts[0]
+        rest = parts[1] if len(parts) > 1 else ''
         
         if command == 'cd':
-            if args:
-                target_dir = args[0]
+            if rest:
+                target_dir = rest.split(None, 1)[0]
                 try:
-                    import os
                     os.chdir(target_dir)
                     return AgentResult(
                         handled=True,
@@ -195,7 +279,6 @@ class CommandRouterAgent(BaseAgent):
                 )
         
         elif command == 'pwd':
-            import os
             current_dir = os.getcwd()
             return AgentResult(
                 handled=True,
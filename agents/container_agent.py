@@ -8,9 +8,9 @@ only runc, bash, and Python standard library modules.
 
 import os
 import json
+import re
 import shutil
 import subprocess
-import tempfile
 import uuid
 from pathlib import Path
 from typing import Dict, Any, Optional, List, Tuple
@@ -20,9 +20,18 @@ from datetime import datetime
 from .base_agent import BaseAgent, AgentResult
 
 
+# Verbs whose following word names an image or a container
+_IMAGE_VERBS = frozenset({'run', 'pull', 'build'})
+_CONTAINER_VERBS = frozenset({'logs', 'exec', 'stop', 'start', 'rm', 'inspect'})
+
+# Images treated as available locally
+_COMMON_IMAGES = ('ubuntu', 'alpine', 'busybox', 'nginx', 'redis', 'postgres')
+
+
 @dataclass
 class ContainerInfo:
     """Information about a container"""
+    __slots__ = ("id", "name", "image", "status", "created", "ports", "mounts")
     id: str
     name: str
     image: str
@@ -35,6 +44,7 @@ class ContainerInfo:
 @dataclass
 class ImageInfo:
     """Information about a container image"""
+    __slots__ = ("id", "name", "tag", "size", "created")
     id: str
     name: str
     tag: str
@@ -54,13 +64,17 @@ class ContainerAgent(BaseAgent):
     No Docker daemon or Docker CLI required.
     """
     
+    # Cached result of the runc PATH lookup (None until first checked)
+    _runc_available: Optional[bool] = None
+    
     def __init__(self, priority: int = 5):
         super().__init__("Container Agent", priority)
         
         # Container storage paths
-        self.containers_dir = Path.home() / ".awesh" / "containers"
-        self.images_dir = Path.home() / ".awesh" / "images"
-        self.runtime_dir = Path.home() / ".awesh" / "runtime"
+        awesh_dir = Path.home() / ".awesh"
+        self.containers_dir = awesh_dir / "containers"
+        self.images_dir = awesh_dir / "images"
+        self.runtime_dir = awesh_dir / "runtime"
         
         # Ensure directories exist
         self.containers_dir.mkdir(parents=True, exist_ok=True)
@@ -76,15 +90,18 @@ class ContainerAgent(BaseAgent):
             'build', 'pull', 'push', 'exec', 'logs', 'ps', 'inspect', 'rm', 'rmi',
             'volume', 'network', 'compose', 'swarm', 'registry'
         ]
+        # All keywords fused into one alternation so detection is a single scan
+        self.container_keyword_re = re.compile(
+            '|'.join(re.escape(keyword) for keyword in self.container_keywords)
+        )
     
     def _check_runc_availability(self) -> bool:
         """Check if runc is available on the system"""
-        try:
-            result = subprocess.run(['runc', '--version'], 
-                                  capture_output=True, text=True, timeout=5)
-            return result.returncode == 0
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            return False
+        # A PATH lookup answers this without spawning runc, and the result is
+        # shared across instances so repeated construction doesn't redo it
+        if ContainerAgent._runc_available is None:
+            ContainerAgent._runc_available = shutil.which('runc') is not None
+        return ContainerAgent._runc_available
     
     def should_handle(self, prompt: str, context: Dict[str, Any]) -> bool:
         """
@@ -97,25 +114,9 @@ class ContainerAgent(BaseAgent):
         Returns:
             True if this agent should handle the prompt
         """
-        prompt_lower = prompt.lower()
-        
-        # Check for container-related keywords
-        for keyword in self.container_keywords:
-            if keyword in prompt_lower:
-                return True
-        
-        # Check for common container commands
-        container_commands = [
-            'docker run', 'docker build', 'docker pull', 'docker push',
-            'docker ps', 'docker logs', 'docker exec', 'docker stop',
-            'docker start', 'docker rm', 'docker rmi', 'docker inspect'
-        ]
-        
-        for command in container_commands:
-            if command in prompt_lower:
-                return True
-        
-        return False
+        # Check for container-related keywords (this also covers every
+        # 'docker <command>' form, since 'docker' is itself a keyword)
+        return self.container_keyword_re.search(prompt.lower()) is not None
     
     async def process(self, prompt: str, context: Dict[str, Any]) -> AgentResult:
         """
@@ -598,7 +599,7 @@ class ContainerAgent(BaseAgent):
         # Simple extraction - look for common patterns
         words = prompt.split()
         for i, word in enumerate(words):
-            if word in ['run', 'pull', 'build'] and i + 1 < len(words):
+            if word in _IMAGE_VERBS and i + 1 < len(words):
                 return words[i + 1]
         return None
     
@@ -606,7 +607,7 @@ class ContainerAgent(BaseAgent):
         """Extract container ID from prompt"""
         words = prompt.split()
         for i, word in enumerate(words):
-            if word in ['logs', 'exec', 'stop', 'start', 'rm', 'inspect'] and i + 1 < len(words):
+            if word in _CONTAINER_VERBS and i + 1 < len(words):
                 return words[i + 1]
         return None
     
@@ -614,8 +615,8 @@ class ContainerAgent(BaseAgent):
         """Check if image exists locally"""
         # For now, return True for common images
         # In a full implementation, check images directory
-        common_images = ['ubuntu', 'alpine', 'busybox', 'nginx', 'redis', 'postgres']
-        return any(img in image_name.lower() for img in common_images)
+        image_lower = image_name.lower()
+        return any(img in image_lower for img in _COMMON_IMAGES)
     
     def _get_container_status(self, container_dir: Path) -> str:
         """Get container status"""
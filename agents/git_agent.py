@@ -4,7 +4,6 @@ Handles repository management, commits, branches, and workflow optimization
 """
 
 import subprocess
-import json
 import os
 from typing import Dict, List, Optional, Any
 from .base_agent import BaseAgent
@@ -21,46 +20,18 @@ class GitAgent(BaseAgent):
             "git_push", "git_pull", "git_fetch", "git_remote",
             "git_reset", "git_revert", "git_stash", "git_blame"
         ]
+        # Command name -> bound handler, so execute() is one dict lookup
+        self._handlers = {
+            command: getattr(self, f"_{command}") for command in self.supported_commands
+        }
     
     def execute(self, command: str, args: Dict[str, Any]) -> Dict[str, Any]:
         """Execute Git MCP command"""
         try:
-            if command == "git_status":
-                return self._git_status(args)
-            elif command == "git_log":
-                return self._git_log(args)
-            elif command == "git_diff":
-                return self._git_diff(args)
-            elif command == "git_add":
-                return self._git_add(args)
-            elif command == "git_commit":
-                return self._git_commit(args)
-            elif command == "git_branch":
-                return self._git_branch(args)
-            elif command == "git_checkout":
-                return self._git_checkout(args)
-            elif command == "git_merge":
-                return self._git_merge(args)
-            elif command == "git_rebase":
-                return self._git_rebase(args)
-            elif command == "git_push":
-                return self._git_push(args)
-            elif command == "git_pull":
-                return self._git_pull(args)
-            elif command == "git_fetch":
-                return self._git_fetch(args)
-            elif command == "git_remote":
-                return self._git_remote(args)
-            elif command == "git_reset":
-                return self._git_reset(args)
-            elif command == "git_revert":
-                return self._git_revert(args)
-            elif command == "git_stash":
-                return self._git_stash(args)
-            elif command == "git_blame":
-                return self._git_blame(args)
-            else:
+            handler = self._handlers.get(command)
+            if handler is None:
                 return {"error": f"Unsupported Git command: {command}"}
+            return handler(args)
         except Exception as e:
             return {"error": f"Git operation failed: {str(e)}"}
     
@@ -8,8 +8,9 @@ processing and direct API communication.
 
 import asyncio
 import json
-import subprocess
+import string
 import sys
+import time
 from pathlib import Path
 from typing import Dict, Any, Optional
 import re
@@ -17,6 +18,16 @@ import re
 from .base_agent import BaseAgent, AgentResult
 
 
+# Maps punctuation (except '_', which is a word character) to spaces so a
+# prompt can be tokenized with one translate() + split()
+_PUNCT_TO_SPACE = str.maketrans({c: ' ' for c in string.punctuation if c != '_'})
+# Fallback tokenizer for non-ASCII prompts (smart quotes, ellipses, dashes)
+_WORD_RE = re.compile(r'\w+')
+# Stream limit for MCP server stdout; responses such as a full pod listing
+# are a single JSON line and easily outgrow asyncio's 64 KiB default
+_MCP_READ_LIMIT = 2 ** 24
+
+
 class KubernetesAgent(BaseAgent):
     """
     Kubernetes Agent that handles Kubernetes-related prompts using direct API calls.
@@ -59,9 +70,26 @@ class KubernetesAgent(BaseAgent):
             r'^k3d\s+',      # k3d commands
             r'^minikube\s+', # minikube commands
         ]
+        # One anchored alternation instead of a re.match() per pattern
+        self.shell_pattern_re = re.compile('|'.join(f'(?:{pattern})' for pattern in self.shell_patterns))
         
         self.mcp_process = None
         self.mcp_ready = False
+        
+        # JSON-RPC requests in flight, keyed by id and resolved by a single
+        # reader task that owns the server's stdout
+        self.mcp_response_timeout = 30.0  # seconds
+        self._mcp_request_id = 0
+        self._mcp_pending: Dict[int, asyncio.Future] = {}
+        self._mcp_reader_task: Optional[asyncio.Task] = None
+        self._mcp_start_lock: Optional[asyncio.Lock] = None
+        
+        # Back off from restarting a server that keeps failing to start, so
+        # every Kubernetes prompt doesn't pay the spawn + startup wait again
+        self.mcp_start_max_failures = 3
+        self.mcp_start_backoff = 10.0  # seconds
+        self._mcp_start_failures = 0
+        self._mcp_retry_after = 0.0
     
     def should_handle(self, prompt: str, context: Dict[str, Any]) -> bool:
         """
@@ -72,25 +100,36 @@ class KubernetesAgent(BaseAgent):
         prompt_lower = prompt.lower()
         
         # Don't handle direct shell commands
-        for pattern in self.shell_patterns:
-            if re.match(pattern, prompt_lower):
-                return False
-        
-        # Check for Kubernetes keywords
-        words = set(re.findall(r'\b\w+\b', prompt_lower))
-        kubernetes_words = words.intersection(self.kubernetes_keywords)
+        if self.shell_pattern_re.match(prompt_lower):
+            return False
         
         # Handle if we found Kubernetes-related terms
-        return len(kubernetes_words) > 0
+        if prompt_lower.isascii():
+            words = prompt_lower.translate(_PUNCT_TO_SPACE).split()
+        else:
+            words = _WORD_RE.findall(prompt_lower)
+        return not self.kubernetes_keywords.isdisjoint(words)
     
     async def process(self, prompt: str, context: Dict[str, Any]) -> AgentResult:
         """
         Process the Kubernetes prompt using the MCP server.
         """
         try:
-            # Start MCP server if not running
-            if not self.mcp_ready:
-                await self._start_mcp_server()
+            # Start MCP server if not running (unless backing off after failures);
+            # the lock keeps concurrent prompts from each spawning a server
+            if self._mcp_start_lock is None:
+                self._mcp_start_lock = asyncio.Lock()
+            async with self._mcp_start_lock:
+                if not self.mcp_ready and time.monotonic() >= self._mcp_retry_after:
+                    await self._start_mcp_server()
+                    
+                    if self.mcp_ready:
+                        self._mcp_start_failures = 0
+                    else:
+                        self._mcp_start_failures += 1
+                        if self._mcp_start_failures >= self.mcp_start_max_failures:
+                            self._mcp_retry_after = time.monotonic() + self.mcp_start_backoff
+                            self._mcp_start_failures = 0
             
             if not self.mcp_ready:
                 return AgentResult(
@@ -125,32 +164,50 @@ class KubernetesAgent(BaseAgent):
             if not Path(self.kubernetes_mcp_path).exists():
                 raise FileNotFoundError(f"Kubernetes MCP server not found at {self.kubernetes_mcp_path}")
             
+            # Make sure a previous server can't be orphaned by the restart
+            await self._stop_mcp_server()
+            
             # Start the MCP server
             self.mcp_process = await asyncio.create_subprocess_exec(
                 sys.executable, self.kubernetes_mcp_path,
                 stdin=asyncio.subprocess.PIPE,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
-                bufsize=0
+                bufsize=0,
+                limit=_MCP_READ_LIMIT
             )
+            self._mcp_reader_task = asyncio.create_task(self._read_mcp_responses(self.mcp_process))
             
-            # Wait a moment for server to start
-            await asyncio.sleep(1)
-            
-            # Initialize the server
+            # Initialize the server; the handshake response doubles as the
+            # readiness signal, so there's no need to sleep before sending it
             init_success = await self._initialize_mcp()
             self.mcp_ready = init_success
+            if not init_success:
+                await self._stop_mcp_server()
             
         except Exception as e:
             print(f"Failed to start Kubernetes MCP server: {e}", file=sys.stderr)
             self.mcp_ready = False
+            await self._stop_mcp_server()
+    
+    async def _stop_mcp_server(self):
+        """Kill the current MCP server process, along with its response reader"""
+        process, self.mcp_process = self.mcp_process, None
+        if self._mcp_reader_task:
+            self._mcp_reader_task.cancel()
+            self._mcp_reader_task = None
+        if process and process.returncode is None:
+            try:
+                process.kill()
+            except ProcessLookupError:
+                pass
+            await process.wait()
     
     async def _initialize_mcp(self) -> bool:
         """Initialize the MCP server"""
         try:
             init_message = {
                 "jsonrpc": "2.0",
-                "id": 1,
                 "method": "initialize",
                 "params": {
                     "protocolVersion": "2024-11-05",
@@ -175,7 +232,6 @@ class KubernetesAgent(BaseAgent):
             # Send prompt using the cluster_health prompt
             prompt_message = {
                 "jsonrpc": "2.0",
-                "id": 2,
                 "method": "prompts/call",
                 "params": {
                     "name": "cluster_health",
@@ -203,34 +259,70 @@ class KubernetesAgent(BaseAgent):
             return None
     
     async def _send_mcp_message(self, message: Dict[str, Any]) -> Dict[str, Any]:
-        """Send a JSON-RPC message to the MCP server"""
+        """Send a JSON-RPC message to the MCP server and wait for its response"""
         if not self.mcp_process or not self.mcp_process.stdin:
             raise Exception("MCP server not running")
         
+        self._mcp_request_id += 1
+        request_id = self._mcp_request_id
+        message = dict(message, id=request_id)
+        
+        future = asyncio.get_running_loop().create_future()
+        self._mcp_pending[request_id] = future
+        
         try:
             # Send message
-            message_line = json.dumps(message) + "\n"
-            self.mcp_process.stdin.write(message_line.encode())
+            message_line = json.dumps(message, separators=(',', ':')).encode() + b"\n"
+            self.mcp_process.stdin.write(message_line)
             await self.mcp_process.stdin.drain()
             
-            # Wait for response
-            await asyncio.sleep(0.2)
-            
-            # Read response
-            if self.mcp_process.stdout.at_eof():
-                raise Exception("MCP server closed stdout")
-            
-            response_line = await self.mcp_process.stdout.readline()
-            if response_line:
-                response_text = response_line.decode().strip()
-                if response_text:
-                    return json.loads(response_text)
+            # The reader task resolves the future as soon as the response arrives
+            return await asyncio.wait_for(future, self.mcp_response_timeout)
             
+        except asyncio.TimeoutError:
+            print("Error communicating with MCP server: timed out waiting for response", file=sys.stderr)
             raise Exception("No response from MCP server")
-            
         except Exception as e:
             print(f"Error communicating with MCP server: {e}", file=sys.stderr)
             raise
+        finally:
+            self._mcp_pending.pop(request_id, None)
+    
+    async def _read_mcp_responses(self, process):
+        """Read responses from the MCP server and hand each to its waiting request"""
+        stdout = process.stdout
+        try:
+            while True:
+                try:
+                    response_line = await stdout.readline()
+                except ValueError:
+                    # Line longer than the stream limit; readline() has already
+                    # discarded it, so the server is still usable
+                    print("Dropped oversized response from MCP server", file=sys.stderr)
+                    continue
+                if not response_line:
+                    break
+                if response_line.isspace():
+                    continue
+                
+                try:
+                    # json.loads takes the raw bytes; no decode/strip copy needed
+                    response = json.loads(response_line)
+                except ValueError:
+                    print(f"Invalid JSON from MCP server: {response_line!r}", file=sys.stderr)
+                    continue
+                
+                future = self._mcp_pending.get(response.get("id"))
+                if future and not future.done():
+                    future.set_result(response)
+        finally:
+            # Server went away: fail anything still waiting and restart on next use.
+            # A replaced server's exit must not touch requests on the current one.
+            if process is self.mcp_process:
+                self.mcp_ready = False
+                for future in self._mcp_pending.values():
+                    if not future.done():
+                        future.set_exception(Exception("MCP server closed stdout"))
     
     def get_help(self) -> str:
         """Get help text for the Kubernetes agent"""
@@ -15,6 +15,10 @@ from dataclasses import dataclass
 from enum import Enum
 
 
+# Leading text that marks a line as a comment rather than a command
+_NON_COMMAND_PREFIXES = ('#', '//', '/*')
+
+
 class ResponseMode(Enum):
     """Response modes for AI output"""
     COMMAND = "command"  # Executable commands
@@ -68,7 +72,7 @@ class ResponseParser:
         commands = []
         for block in command_blocks:
             # Split commands by newlines and clean them
-            block_commands = [cmd.strip() for cmd in block.split('\n') if cmd.strip()]
+            block_commands = [cmd for cmd in map(str.strip, block.split('\n')) if cmd]
             commands.extend(block_commands)
         
         # Extract edit blocks
@@ -109,7 +113,7 @@ class ResponseParser:
         commands = []
         for block in legacy_commands:
             # Split commands by newlines and clean them
-            block_commands = [cmd.strip() for cmd in block.split('\n') if cmd.strip()]
+            block_commands = [cmd for cmd in map(str.strip, block.split('\n')) if cmd]
             commands.extend(block_commands)
         
         # Remove command blocks from response to get edit content
@@ -219,26 +223,20 @@ IMPORTANT:
         Returns:
             True if command appears valid
         """
-        # Skip empty commands
-        if not command.strip():
-            return False
+        stripped = command.strip()
         
-        # Skip comments
-        if command.strip().startswith('#'):
+        # Skip empty commands
+        if not stripped:
             return False
         
-        # Skip obvious non-commands
-        if command.strip().startswith('//') or command.strip().startswith('/*'):
+        # Skip comments and obvious non-commands
+        if stripped.startswith(_NON_COMMAND_PREFIXES):
             return False
         
         # Basic checks
         if len(command) > 1000:  # Too long
             return False
         
-        # Must have at least one non-whitespace character
-        if not command.strip():
-            return False
-        
         return True
     
     def extract_commands_for_execution(self, response: str) -> List[str]:
@@ -6,15 +6,14 @@ Works on Windows, Mac, and Linux with Dynamic Prompt Handling
 
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox
-import asyncio
 import json
 import subprocess
 import threading
 import queue
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any
 import sys
 import os
-import time
 from datetime import datetime
 
 class KubernetesMCPGUI:
@@ -28,11 +27,16 @@ class KubernetesMCPGUI:
         
         # Server process
         self.server_process = None
-        self.server_ready = False
+        # Set by the server thread, read by the Tk thread
+        self.server_ready = threading.Event()
         
         # Message queue for async operations
         self.message_queue = queue.Queue()
         
+        # One reused worker sends prompts; requests share the server's pipes,
+        # so they are sent one at a time in the order they were entered
+        self.prompt_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="mcp-prompt")
+        
         # Conversation history
         self.conversation_history = []
         
@@ -266,7 +270,7 @@ class KubernetesMCPGUI:
                 response = json.loads(response_line.decode().strip())
                 if "result" in response:
                     self.message_queue.put(("success", "Server initialized successfully"))
-                    self.server_ready = True
+                    self.server_ready.set()
                 else:
                     self.message_queue.put(("error", f"Initialization failed: {response}"))
             else:
@@ -283,7 +287,7 @@ class KubernetesMCPGUI:
                 self.server_process.wait()
                 self.server_process = None
             
-            self.server_ready = False
+            self.server_ready.clear()
             self.start_button.config(state='normal')
             self.stop_button.config(state='disabled')
             self.send_button.config(state='disabled')
@@ -294,7 +298,7 @@ class KubernetesMCPGUI:
     
     def send_prompt(self):
         """Send a natural language prompt"""
-        if not self.server_ready:
+        if not self.server_ready.is_set():
             messagebox.showwarning("Warning", "Server not ready. Please start the server first.")
             return
         
@@ -323,9 +327,7 @@ class KubernetesMCPGUI:
         self.response_text.insert(tk.END, "=" * 50 + "\n\n")
         
         # Send prompt in background thread
-        prompt_thread = threading.Thread(target=self._send_prompt_thread, args=(prompt,))
-        prompt_thread.daemon = True
-        prompt_thread.start()
+        self.prompt_executor.submit(self._send_prompt_thread, prompt)
         
         # Clear prompt entry
         self.prompt_var.set("")
@@ -357,10 +359,9 @@ class KubernetesMCPGUI:
                 response = json.loads(response_line.decode().strip())
                 if "result" in response:
                     content = response["result"]["content"]
-                    response_text = ""
-                    for item in content:
-                        if item["type"] == "text":
-                            response_text += item["text"] + "\n"
+                    response_text = "".join(
+                        item["text"] + "\n" for item in content if item["type"] == "text"
+                    )
                     
                     # Update conversation history with response
                     if self.conversation_history:
@@ -481,6 +482,7 @@ class KubernetesMCPGUI:
         """Handle window closing"""
         if self.server_process:
             self.stop_server()
+        self.prompt_executor.shutdown(wait=False)
         self.root.destroy()
 
 def main():
@@ -6,28 +6,68 @@ This version properly handles the communication and continuously asks for prompt
 
 import asyncio
 import json
-import subprocess
 import sys
+import threading
+from pathlib import Path
 from typing import Dict, Any
 
+try:
+    import readline
+except ImportError:  # not available on Windows
+    readline = None
+
+try:
+    import termios
+except ImportError:  # not available on Windows
+    termios = None
+
+HISTORY_FILE = Path.home() / ".awesh" / "k8s_client_history"
+
+# Server responses are single JSON lines and can outgrow asyncio's 64 KiB
+# default stream limit (e.g. a full pod listing)
+READ_LIMIT = 2 ** 24
+
+# Startup banner, written in one go rather than line by line
+BANNER = "\n".join([
+    "🧪 Working Interactive Kubernetes MCP Client",
+    "=" * 50,
+    "💡 Type natural language prompts to interact with your cluster",
+    "💡 Examples:",
+    "   • 'Show me the cluster health'",
+    "   • 'What nodes do I have?'",
+    "   • 'Get pods in default namespace'",
+    "   • 'Show me the services'",
+    "   • 'Check cluster status'",
+    "💡 Type 'quit' to exit",
+    "",
+])
+
 class WorkingInteractiveMCPClient:
     """Working interactive client that continuously asks for prompts"""
     
     def __init__(self):
         self.process = None
         self.server_ready = False
+        self.request_id = 0
+        self.pending_requests: Dict[int, asyncio.Future] = {}
+        self.reader_task = None
+        self.response_timeout = 30.0
+        # History entries read from disk; None until load_history() has run
+        self.history_start = None
     
     async def start_server(self):
         """Start the MCP server as a subprocess"""
         try:
             # Start server with proper pipe configuration
             self.process = await asyncio.create_subprocess_exec(
-                "python3", "smart_k8s_mcp.py",
+                sys.executable, "smart_k8s_mcp.py",
                 stdin=asyncio.subprocess.PIPE,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
-                bufsize=0  # No buffering
+                bufsize=0,  # No buffering
+                limit=READ_LIMIT
             )
+            self.reader_task = asyncio.create_task(self.read_responses())
             print("🚀 Started Smart Kubernetes MCP Server")
             return True
         except Exception as e:
@@ -38,6 +78,15 @@ class WorkingInteractiveMCPClient:
         """Send a message to the MCP server and get response"""
         if not self.process:
             raise Exception("Server not started")
+        if self.reader_task is None or self.reader_task.done():
+            return {"error": "Server closed stdout"}
+        
+        self.request_id += 1
+        request_id = self.request_id
+        message = dict(message, id=request_id)
+        
+        future = asyncio.get_running_loop().create_future()
+        self.pending_requests[request_id] = future
         
         try:
             # Send message
@@ -45,29 +94,111 @@ class WorkingInteractiveMCPClient:
             self.process.stdin.write(message_line.encode())
             await self.process.stdin.drain()
             
-            # Wait for response
-            await asyncio.sleep(0.2)
-            
-            # Read response
-            if self.process.stdout.at_eof():
-                return {"error": "Server closed stdout"}
-            
-            response_line = await self.process.stdout.readline()
-            if response_line:
-                response_text = response_line.decode().strip()
-                if response_text:
-                    try:
-                        return json.loads(response_text)
-                    except json.JSONDecodeError:
-                        return {"error": f"Invalid JSON response: {response_text}"}
-                else:
-                    return {"error": "Empty response from server"}
-            else:
-                return {"error": "No response from server"}
+            # The reader task resolves the future when the matching response arrives
+            return await asyncio.wait_for(future, self.response_timeout)
                 
+        except asyncio.TimeoutError:
+            print("❌ Timed out waiting for server response")
+            return {"error": "Timed out waiting for server response"}
         except Exception as e:
             print(f"❌ Error communicating with server: {e}")
             return {"error": str(e)}
+        finally:
+            self.pending_requests.pop(request_id, None)
+    
+    async def read_responses(self):
+        """Read server responses and route each one to the request with its id"""
+        try:
+            while True:
+                try:
+                    response_line = await self.process.stdout.readline()
+                except ValueError:
+                    # Line longer than the stream limit; readline() has already
+                    # discarded it, so keep reading
+                    print("❌ Dropped oversized server response")
+                    continue
+                if not response_line:
+                    break
+                
+                response_text = response_line.decode().strip()
+                if not response_text:
+                    continue
+                
+                try:
+                    response = json.loads(response_text)
+                except json.JSONDecodeError:
+                    print(f"❌ Invalid JSON response: {response_text}")
+                    continue
+                
+                future = self.pending_requests.get(response.get("id"))
+                if future and not future.done():
+                    future.set_result(response)
+        finally:
+            for future in self.pending_requests.values():
+                if not future.done():
+                    future.set_result({"error": "Server closed stdout"})
+    
+    def load_history(self):
+        """Enable line editing with persistent, prefix-searchable prompt history"""
+        if readline is None:
+            return
+        
+        readline.set_history_length(1000)
+        # Up/Down recall earlier prompts starting with what's already typed
+        if "libedit" not in (readline.__doc__ or ""):
+            readline.parse_and_bind(r'"\e[A": history-search-backward')
+            readline.parse_and_bind(r'"\e[B": history-search-forward')
+        
+        try:
+            readline.read_history_file(str(HISTORY_FILE))
+        except OSError:
+            pass
+        self.history_start = readline.get_current_history_length()
+    
+    def save_history(self):
+        """Append this session's prompts to the history file"""
+        # Nothing was loaded (e.g. startup failed), so there's nothing to save
+        # and writing now would clobber the file with an empty history
+        if readline is None or self.history_start is None:
+            return
+        
+        new_entries = readline.get_current_history_length() - self.history_start
+        if new_entries <= 0:
+            return
+        
+        try:
+            HISTORY_FILE.parent.mkdir(parents=True, exist_ok=True)
+            # Appending (trimmed to the history length) rather than rewriting
+            # keeps concurrent clients from overwriting each other's prompts
+            if hasattr(readline, "append_history_file"):
+                HISTORY_FILE.touch(exist_ok=True)
+                readline.append_history_file(new_entries, str(HISTORY_FILE))
+            else:
+                readline.write_history_file(str(HISTORY_FILE))
+        except OSError:
+            pass
+    
+    async def read_prompt(self, prompt_text: str) -> str:
+        """Read a line from the user without blocking the event loop"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        
+        def resolve(setter, value):
+            if not future.done():
+                setter(value)
+        
+        def read_line():
+            try:
+                line = input(prompt_text)
+            except BaseException as e:  # EOFError, KeyboardInterrupt
+                loop.call_soon_threadsafe(resolve, future.set_exception, e)
+            else:
+                loop.call_soon_threadsafe(resolve, future.set_result, line)
+        
+        # Daemon thread rather than the default executor, so a read still
+        # blocked in input() can't hold up interpreter shutdown on Ctrl+C
+        threading.Thread(target=read_line, daemon=True).start()
+        return await future
     
     async def initialize_server(self):
         """Initialize the MCP server"""
@@ -75,7 +206,6 @@ class WorkingInteractiveMCPClient:
         
         init_message = {
             "jsonrpc": "2.0",
-            "id": 1,
             "method": "initialize",
             "params": {
                 "protocolVersion": "2024-11-05",
@@ -107,7 +237,6 @@ class WorkingInteractiveMCPClient:
         # Send prompt
         prompt_message = {
             "jsonrpc": "2.0",
-            "id": 2,
             "method": "prompts/call",
             "params": {
                 "name": "cluster_health",
@@ -129,28 +258,21 @@ class WorkingInteractiveMCPClient:
     
     async def run_interactive(self):
         """Run interactive prompt loop"""
-        print("🧪 Working Interactive Kubernetes MCP Client")
-        print("=" * 50)
-        print("💡 Type natural language prompts to interact with your cluster")
-        print("💡 Examples:")
-        print("   • 'Show me the cluster health'")
-        print("   • 'What nodes do I have?'")
-        print("   • 'Get pods in default namespace'")
-        print("   • 'Show me the services'")
-        print("   • 'Check cluster status'")
-        print("💡 Type 'quit' to exit")
-        print()
+        print(BANNER)
         
         # Start server
         if not await self.start_server():
             return
         
+        # readline puts the tty in raw mode while input() waits in the reader
+        # thread; if we exit mid-read (Ctrl+C) the terminal must be restored
+        saved_tty = None
+        if termios is not None and sys.stdin.isatty():
+            saved_tty = termios.tcgetattr(sys.stdin)
+        
         try:
-            # Wait for server to start
-            print("⏳ Waiting for server to start...")
-            await asyncio.sleep(3)
-            
-            # Initialize server
+            # Initialize server; the request waits in the pipe until the
+            # server is reading, so no fixed startup delay is needed
             await self.initialize_server()
             
             if not self.server_ready:
@@ -158,11 +280,13 @@ class WorkingInteractiveMCPClient:
                 return
             
             print("\n🎉 Ready to process prompts! Type your requests below.")
+            self.load_history()
             
-            # Interactive loop
+            # Interactive loop; prompts are read off the event loop so the
+            # response reader keeps running while we wait for input
             while True:
                 try:
-                    prompt = input("\n🤖 Enter your prompt: ").strip()
+                    prompt = (await self.read_prompt("\n🤖 Enter your prompt: ")).strip()
                     
                     if prompt.lower() in ['quit', 'exit', 'q']:
                         print("👋 Goodbye!")
@@ -173,7 +297,7 @@ class WorkingInteractiveMCPClient:
                     
                     await self.process_prompt(prompt)
                     
-                except KeyboardInterrupt:
+                except (KeyboardInterrupt, asyncio.CancelledError):
                     print("\n👋 Goodbye!")
                     break
                 except EOFError:
@@ -187,6 +311,9 @@ class WorkingInteractiveMCPClient:
         
         finally:
             # Cleanup
+            self.save_history()
+            if saved_tty is not None:
+                termios.tcsetattr(sys.stdin, termios.TCSADRAIN, saved_tty)
             if self.process:
                 self.process.terminate()
                 await self.process.wait()
@@ -198,4 +325,13 @@ async def main():
     await client.run_interactive()
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Use the libuv-based event loop when it's installed
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
@@ -9,6 +9,7 @@ import json
 import logging
 import sys
 import re
+from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 from kubernetes import client, config
 from kubernetes.client.rest import ApiException
@@ -17,6 +18,94 @@ from kubernetes.client.rest import ApiException
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Entity extraction patterns, compiled once and tried in priority order
+_NAMESPACE_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r"in (\w+) namespace",
+    r"namespace (\w+)",
+    r"from (\w+)",
+    r"(\w+) namespace",
+))
+
+_POD_NAME_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r"pod (\w+)",
+    r"(\w+) pod",
+    r"container (\w+)",
+    r"(\w+) container",
+))
+
+_APP_NAME_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r"deploy (\w+)",
+    r"deploy an? (\w+)",
+    r"create (\w+)",
+    r"create an? (\w+)",
+    r"(\w+) deployment",
+    r"deploy (\w+) app",
+))
+
+# Static MCP listings, built once rather than on every list request
+_TOOL_DEFINITIONS = [
+    {
+        "name": "get_pods",
+        "description": "Get pods from a namespace",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "namespace": {
+                    "type": "string",
+                    "description": "Namespace to get pods from (default: default)"
+                }
+            }
+        }
+    },
+    {
+        "name": "get_nodes",
+        "description": "Get cluster nodes",
+        "inputSchema": {
+            "type": "object",
+            "properties": {}
+        }
+    }
+]
+
+_PROMPT_DEFINITIONS = [
+    {
+        "name": "cluster_health",
+        "description": "Check cluster health and status",
+        "arguments": {
+            "type": "object",
+            "properties": {
+                "prompt": {
+                    "type": "string",
+                    "description": "Natural language prompt about cluster health"
+                }
+            },
+            "required": ["prompt"]
+        }
+    },
+    {
+        "name": "pod_management",
+        "description": "Manage and inspect pods",
+        "arguments": {
+            "type": "object",
+            "properties": {
+                "prompt": {
+                    "type": "string",
+                    "description": "Natural language prompt about pod operations"
+                }
+            },
+            "required": ["prompt"]
+        }
+    }
+]
+
+@dataclass(frozen=True)
+class ParsedIntent:
+    """Intent extracted from a natural language prompt"""
+    __slots__ = ("action", "args", "description")
+    action: str
+    args: Dict[str, Any]
+    description: str
+
 class SmartKubernetesMCPServer:
     """Smart Kubernetes MCP Server with natural language processing"""
     
@@ -44,18 +133,18 @@ class SmartKubernetesMCPServer:
         self.networking_v1 = client.NetworkingV1Api()
         self.rbac_v1 = client.RbacAuthorizationV1Api()
     
-    def parse_natural_language(self, prompt: str) -> Dict[str, Any]:
+    def parse_natural_language(self, prompt: str) -> ParsedIntent:
         """Parse natural language prompt and extract intent and parameters"""
         prompt_lower = prompt.lower()
         
         # Node-related queries
         if any(word in prompt_lower for word in ["node", "nodes", "cluster", "servers"]):
             if "status" in prompt_lower or "health" in prompt_lower:
-                return {"action": "get_nodes", "args": {}, "description": "Getting cluster node status and health"}
+                return ParsedIntent("get_nodes", {}, "Getting cluster node status and health")
             elif "capacity" in prompt_lower or "resources" in prompt_lower:
-                return {"action": "get_nodes", "args": {}, "description": "Getting cluster node capacity and resources"}
+                return ParsedIntent("get_nodes", {}, "Getting cluster node capacity and resources")
             else:
-                return {"action": "get_nodes", "args": {}, "description": "Getting cluster nodes information"}
+                return ParsedIntent("get_nodes", {}, "Getting cluster nodes information")
         
         # Pod-related queries
         elif any(word in prompt_lower for word in ["pod", "pods", "containers"]):
@@ -63,34 +152,26 @@ class SmartKubernetesMCPServer:
             if "logs" in prompt_lower:
                 pod_name = self.extract_pod_name(prompt)
                 if pod_name:
-                    return {
-                        "action": "get_pod_logs", 
-                        "args": {"name": pod_name, "namespace": namespace},
-                        "description": f"Getting logs for pod {pod_name}"
-                    }
+                    return ParsedIntent("get_pod_logs", {"name": pod_name, "namespace": namespace}, f"Getting logs for pod {pod_name}")
                 else:
-                    return {"action": "get_all_pods", "args": {}, "description": "Getting all pods across all namespaces"}
+                    return ParsedIntent("get_all_pods", {}, "Getting all pods across all namespaces")
             elif "describe" in prompt_lower or "details" in prompt_lower or "info" in prompt_lower:
                 pod_name = self.extract_pod_name(prompt)
                 if pod_name:
-                    return {
-                        "action": "describe_pod", 
-                        "args": {"name": pod_name, "namespace": namespace},
-                        "description": f"Getting detailed information for pod {pod_name}"
-                    }
+                    return ParsedIntent("describe_pod", {"name": pod_name, "namespace": namespace}, f"Getting detailed information for pod {pod_name}")
                 else:
-                    return {"action": "get_all_pods", "args": {}, "description": "Getting all pods across all namespaces"}
+                    return ParsedIntent("get_all_pods", {}, "Getting all pods across all namespaces")
             else:
                 # If no specific namespace mentioned, get all pods
                 if "namespace" not in prompt_lower or "default" in prompt_lower:
-                    return {"action": "get_all_pods", "args": {}, "description": "Getting all pods across all namespaces"}
+                    return ParsedIntent("get_all_pods", {}, "Getting all pods across all namespaces")
                 else:
-                    return {"action": "get_pods", "args": {"namespace": namespace}, "description": f"Getting pods in {namespace} namespace"}
+                    return ParsedIntent("get_pods", {"namespace": namespace}, f"Getting pods in {namespace} namespace")
         
         # Service-related queries
         elif any(word in prompt_lower for word in ["service", "services", "svc"]):
             namespace = self.extract_namespace(prompt)
-            return {"action": "get_services", "args": {"namespace": namespace}, "description": "Getting services information"}
+            return ParsedIntent("get_services", {"namespace": namespace}, "Getting services information")
         
         # Deployment-related queries
         elif any(word in prompt_lower for word in ["deployment", "deployments", "deploy"]):
@@ -99,36 +180,28 @@ class SmartKubernetesMCPServer:
                 # Extract app name from prompt
                 app_name = self.extract_app_name(prompt)
                 if app_name:
-                    return {"action": "create_deployment", "args": {"name": app_name, "namespace": namespace}, "description": f"Creating {app_name} deployment"}
+                    return ParsedIntent("create_deployment", {"name": app_name, "namespace": namespace}, f"Creating {app_name} deployment")
                 else:
-                    return {"action": "get_deployments", "args": {"namespace": namespace}, "description": "Getting deployments information"}
+                    return ParsedIntent("get_deployments", {"namespace": namespace}, "Getting deployments information")
             else:
-                return {"action": "get_deployments", "args": {"namespace": namespace}, "description": "Getting deployments information"}
+                return ParsedIntent("get_deployments", {"namespace": namespace}, "Getting deployments information")
         
         # Namespace-related queries
         elif any(word in prompt_lower for word in ["namespace", "namespaces", "ns"]):
-            return {"action": "get_namespaces", "args": {}, "description": "Getting all namespaces"}
+            return ParsedIntent("get_namespaces", {}, "Getting all namespaces")
         
         # Health/status queries
         elif any(word in prompt_lower for word in ["health", "status", "overview", "summary"]):
-            return {"action": "get_cluster_overview", "args": {}, "description": "Getting cluster health and status overview"}
+            return ParsedIntent("get_cluster_overview", {}, "Getting cluster health and status overview")
         
         # Default to cluster overview
         else:
-            return {"action": "get_cluster_overview", "args": {}, "description": "Getting general cluster information"}
+            return ParsedIntent("get_cluster_overview", {}, "Getting general cluster information")
     
     def extract_namespace(self, prompt: str) -> str:
         """Extract namespace from prompt"""
-        # Look for namespace patterns
-        patterns = [
-            r"in (\w+) namespace",
-            r"namespace (\w+)",
-            r"from (\w+)",
-            r"(\w+) namespace"
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, prompt, re.IGNORECASE)
+        for pattern in _NAMESPACE_PATTERNS:
+            match = pattern.search(prompt)
             if match:
                 return match.group(1)
         
@@ -136,16 +209,8 @@ class SmartKubernetesMCPServer:
     
     def extract_pod_name(self, prompt: str) -> Optional[str]:
         """Extract pod name from prompt"""
-        # Look for pod name patterns
-        patterns = [
-            r"pod (\w+)",
-            r"(\w+) pod",
-            r"container (\w+)",
-            r"(\w+) container"
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, prompt, re.IGNORECASE)
+        for pattern in _POD_NAME_PATTERNS:
+            match = pattern.search(prompt)
             if match:
                 return match.group(1)
         
@@ -153,18 +218,8 @@ class SmartKubernetesMCPServer:
     
     def extract_app_name(self, prompt: str) -> Optional[str]:
         """Extract application name from deployment prompt"""
-        # Look for app name patterns
-        patterns = [
-            r"deploy (\w+)",
-            r"deploy an? (\w+)",
-            r"create (\w+)",
-            r"create an? (\w+)",
-            r"(\w+) deployment",
-            r"deploy (\w+) app"
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, prompt, re.IGNORECASE)
+        for pattern in _APP_NAME_PATTERNS:
+            match = pattern.search(prompt)
             if match:
                 return match.group(1)
         
@@ -178,41 +233,41 @@ class SmartKubernetesMCPServer:
             
             # Parse the natural language
             parsed = self.parse_natural_language(prompt)
-            print(f"🔍 Interpreted as: {parsed['description']}", file=sys.stderr)
+            print(f"🔍 Interpreted as: {parsed.description}", file=sys.stderr)
             
             # Execute the action
-            if parsed["action"] == "get_cluster_overview":
-                result = await self.get_cluster_overview(parsed["args"])
-            elif parsed["action"] == "get_pods":
-                result = await self.get_pods(parsed["args"])
-            elif parsed["action"] == "get_all_pods":
-                result = await self.get_all_pods(parsed["args"])
-            elif parsed["action"] == "get_services":
-                result = await self.get_services(parsed["args"])
-            elif parsed["action"] == "get_deployments":
-                result = await self.get_deployments(parsed["args"])
-            elif parsed["action"] == "create_deployment":
-                result = await self.create_deployment(parsed["args"])
-            elif parsed["action"] == "get_nodes":
-                result = await self.get_nodes(parsed["args"])
-            elif parsed["action"] == "get_namespaces":
-                result = await self.get_namespaces(parsed["args"])
-            elif parsed["action"] == "describe_pod":
-                result = await self.describe_pod(parsed["args"])
-            elif parsed["action"] == "get_pod_logs":
-                result = await self.get_pod_logs(parsed["args"])
+            if parsed.action == "get_cluster_overview":
+                result = await self.get_cluster_overview(parsed.args)
+            elif parsed.action == "get_pods":
+                result = await self.get_pods(parsed.args)
+            elif parsed.action == "get_all_pods":
+                result = await self.get_all_pods(parsed.args)
+            elif parsed.action == "get_services":
+                result = await self.get_services(parsed.args)
+            elif parsed.action == "get_deployments":
+                result = await self.get_deployments(parsed.args)
+            elif parsed.action == "create_deployment":
+                result = await self.create_deployment(parsed.args)
+            elif parsed.action == "get_nodes":
+                result = await self.get_nodes(parsed.args)
+            elif parsed.action == "get_namespaces":
+                result = await self.get_namespaces(parsed.args)
+            elif parsed.action == "describe_pod":
+                result = await self.describe_pod(parsed.args)
+            elif parsed.action == "get_pod_logs":
+                result = await self.get_pod_logs(parsed.args)
             else:
                 return {
                     "jsonrpc": "2.0",
                     "id": message.get("id"),
                     "error": {
                         "code": -32601,
-                        "message": f"Unknown action: {parsed['action']}"
+                        "message": f"Unknown action: {parsed.action}"
                     }
                 }
             
             # Format the response with natural language summary
-            summary = self.generate_summary(parsed["action"], result, prompt)
+            summary = self.generate_summary(parsed.action, result, prompt)
             
             return {
                 "jsonrpc": "2.0",
@@ -633,14 +688,15 @@ class SmartKubernetesMCPServer:
                 if not line:
                     break
                 
-                line = line.strip()
-                if not line:
+                # json.loads ignores surrounding whitespace, so only blank
+                # lines need checking; no stripped copy of each request
+                if line.isspace():
                     continue
                 
                 try:
                     message = json.loads(line)
                 except json.JSONDecodeError:
-                    print(f"Invalid JSON: {line}", file=sys.stderr)
+                    print(f"Invalid JSON: {line.strip()}", file=sys.stderr)
                     continue
                 
                 # Handle different message types
@@ -705,76 +761,21 @@ class SmartKubernetesMCPServer:
     
     async def handle_list_tools(self, message: Dict[str, Any]) -> Dict[str, Any]:
         """Handle list tools request"""
-        tools = [
-            {
-                "name": "get_pods",
-                "description": "Get pods from a namespace",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "namespace": {
-                            "type": "string",
-                            "description": "Namespace to get pods from (default: default)"
-                        }
-                    }
-                }
-            },
-            {
-                "name": "get_nodes",
-                "description": "Get cluster nodes",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {}
-                }
-            }
-        ]
-        
         return {
             "jsonrpc": "2.0",
             "id": message.get("id"),
             "result": {
-                "tools": tools
+                "tools": _TOOL_DEFINITIONS
             }
         }
     
     async def handle_list_prompts(self, message: Dict[str, Any]) -> Dict[str, Any]:
         """Handle list prompts request"""
-        prompts = [
-            {
-                "name": "cluster_health",
-                "description": "Check cluster health and status",
-                "arguments": {
-                    "type": "object",
-                    "properties": {
-                        "prompt": {
-                            "type": "string",
-                            "description": "Natural language prompt about cluster health"
-                        }
-                    },
-                    "required": ["prompt"]
-                }
-            },
-            {
-                "name": "pod_management",
-                "description": "Manage and inspect pods",
-                "arguments": {
-                    "type": "object",
-                    "properties": {
-                        "prompt": {
-                            "type": "string",
-                            "description": "Natural language prompt about pod operations"
-                        }
-                    },
-                    "required": ["prompt"]
-                }
-            }
-        ]
-        
         return {
             "jsonrpc": "2.0",
             "id": message.get("id"),
             "result": {
-                "prompts": prompts
+                "prompts": _PROMPT_DEFINITIONS
             }
         }
     
@@ -828,4 +829,10 @@ async def main():
     await server.run()
 
 if __name__ == "__main__":
+    # Use the libuv-based event loop when it's installed
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
     asyncio.run(main())